@@ -1,41 +1,113 @@
 
 # Neo4j interaction example
+import atexit
+
 from neo4j import GraphDatabase
 
-def create_agent(tx, agent_id, capabilities):
-    tx.run("MERGE (a:Agent {id: $agent_id}) "
-           "SET a.capabilities = $capabilities",
-           agent_id=agent_id, capabilities=capabilities)
+NEO4J_URI = "neo4j://localhost:7687"
+NEO4J_AUTH = ("user", "password")
 
-def update_agent_capabilities(tx, agent_id, new_capabilities):
-    tx.run("MATCH (a:Agent {id: $agent_id}) "
-           "SET a.capabilities = $new_capabilities",
-           agent_id=agent_id, new_capabilities=new_capabilities)
+# Rows per write transaction; keeps each commit well under the server's memory limits
+BATCH_SIZE = 10_000
 
-def record_task_assignment(tx, agent_id, task_id, status):
+def create_agents_bulk(tx, rows):
+    tx.run("UNWIND $rows AS row "
+           "MERGE (a:Agent {id: row.id}) "
+           "SET a.capabilities = row.capabilities",
+           rows=rows)
+
+def update_agent_capabilities_bulk(tx, rows):
+    tx.run("UNWIND $rows AS row "
+           "MATCH (a:Agent {id: row.id}) "
+           "SET a.capabilities = row.capabilities",
+           rows=rows)
+
+def record_task_assignments_bulk(tx, rows):
     tx.run(
-        "MERGE (t:Task {id: $task_id}) "
-        "MERGE (a:Agent {id: $agent_id}) "
+        "UNWIND $rows AS row "
+        "MERGE (t:Task {id: row.task_id}) "
+        "MERGE (a:Agent {id: row.agent_id}) "
         "MERGE (a)-[r:ASSIGNED_TO]->(t) "
-        "SET r.status = $status, r.timestamp = datetime()",
-        agent_id=agent_id, task_id=task_id, status=status
+        "SET r.status = row.status, r.timestamp = datetime()",
+        rows=rows
     )
 
+def create_agent(tx, agent_id, capabilities):
+    create_agents_bulk(tx, [{"id": agent_id, "capabilities": capabilities}])
+
+def update_agent_capabilities(tx, agent_id, new_capabilities):
+    update_agent_capabilities_bulk(tx, [{"id": agent_id, "capabilities": new_capabilities}])
+
+def record_task_assignment(tx, agent_id, task_id, status):
+    record_task_assignments_bulk(tx, [{"agent_id": agent_id, "task_id": task_id, "status": status}])
+
+def write_pending(tx, agents, updates, assignments):
+    """Apply one batch of pending rows inside a single transaction / commit."""
+    if agents:
+        create_agents_bulk(tx, agents)
+    if updates:
+        update_agent_capabilities_bulk(tx, updates)
+    if assignments:
+        record_task_assignments_bulk(tx, assignments)
+
+def flush(session, agents, updates, assignments, batch_size=BATCH_SIZE):
+    """Commit pending rows in order, one transaction per batch_size rows, then clear them."""
+    pending = (agents, updates, assignments)
+    chunk, size = [[], [], []], 0
+    for i, rows in enumerate(pending):
+        start = 0
+        while start < len(rows):
+            chunk[i] = rows[start:start + batch_size - size]
+            size += len(chunk[i])
+            start += len(chunk[i])
+            if size == batch_size:
+                session.execute_write(write_pending, *chunk)
+                chunk, size = [[], [], []], 0
+    if size:
+        session.execute_write(write_pending, *chunk)
+    for rows in pending:
+        rows.clear()
+
 def get_agent_performance(tx, agent_id):
     result = tx.run(
-        "MATCH (a:Agent {id: $agent_id})-[r:ASSIGNED_TO]->(t:Task) "
-        "RETURN r.status AS status, count(*) AS count "
-        "GROUP BY r.status",
+        "MATCH (a:Agent {id: $agent_id})-[r:ASSIGNED_TO]->() "
+        "RETURN r.status AS status, count(*) AS count",
         agent_id=agent_id
     )
     return {record["status"]: record["count"] for record in result}
 
-with GraphDatabase.driver("neo4j://localhost:7687", auth=("user", "password")) as driver:
-    with driver.session() as session:
+def create_constraints(tx):
+    # Uniqueness constraints are index-backed, so MERGE and MATCH on id become point lookups
+    tx.run("CREATE CONSTRAINT agent_id IF NOT EXISTS FOR (a:Agent) REQUIRE a.id IS UNIQUE")
+    tx.run("CREATE CONSTRAINT task_id IF NOT EXISTS FOR (t:Task) REQUIRE t.id IS UNIQUE")
+
+# One pooled driver per process so repeated loop iterations skip the TCP + Bolt handshake
+_DRIVER = GraphDatabase.driver(NEO4J_URI, auth=NEO4J_AUTH, max_connection_pool_size=50)
+atexit.register(_DRIVER.close)
+
+_SCHEMA_READY = False
+
+def get_session():
+    global _SCHEMA_READY
+    session = _DRIVER.session(database="neo4j")
+    if not _SCHEMA_READY:
+        try:
+            session.execute_write(create_constraints)
+        except Exception:
+            session.close()
+            raise
+        _SCHEMA_READY = True
+    return session
+
+if __name__ == "__main__":
+    with get_session() as session:
         try:
-            session.execute_write(create_agent, "agent-123", ["coding", "testing"])
-            session.execute_write(update_agent_capabilities, "agent-123", ["coding", "testing", "debugging"])
-            session.execute_write(record_task_assignment, "agent-123", "task-456", "completed")
+            flush(
+                session,
+                [{"id": "agent-123", "capabilities": ["coding", "testing"]}],
+                [{"id": "agent-123", "capabilities": ["coding", "testing", "debugging"]}],
+                [{"agent_id": "agent-123", "task_id": "task-456", "status": "completed"}],
+            )
             performance = session.execute_read(get_agent_performance, "agent-123")
             print(f"Agent performance: {performance}")
         except Exception as e:
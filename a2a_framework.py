@@ -1,13 +1,16 @@
 import asyncio
+import logging
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Set
+
+logger = logging.getLogger(__name__)
 
 class MessageType(Enum):
     REQUEST = auto()
     RESPONSE = auto()
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapability:
     name: str
     description: str
@@ -16,7 +19,7 @@ class AgentCapability:
     reliability: float
     tools: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class A2AMessage:
     sender: str
     receiver: str
@@ -30,13 +33,37 @@ class A2AAgent:
         self.name = name
         self.capabilities = capabilities
         self.orchestrator = orchestrator
-        self.peers: List[str] = []
+        self.peers: Set[str] = set()
+        # While the agent is started, every send_message/send_messages delivery lands here
+        # in arrival order; stopped agents receive inline and errors reach the sender.
+        # None is the stop sentinel: the consumer exits once everything before it is handled
+        self._inbox: 'asyncio.Queue[List[A2AMessage] | None] | None' = None
+        self._consumer: 'asyncio.Task | None' = None
+
+    @property
+    def peers_list(self) -> List[str]:
+        return sorted(self.peers)
 
     async def start(self) -> None:
-        await asyncio.sleep(0)
+        if self._consumer is None:
+            self._inbox = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._drain_inbox())
 
     async def stop(self) -> None:
-        await asyncio.sleep(0)
+        if self._consumer is None:
+            return
+        inbox, consumer = self._inbox, self._consumer
+        # Finish delivering everything queued ahead of the sentinel, or stop early if the consumer dies
+        inbox.put_nowait(None)
+        await asyncio.wait((consumer,))
+        self._consumer = self._inbox = None
+        if consumer.cancelled():
+            raise RuntimeError(f"Inbox consumer of agent {self.agent_id} was cancelled")
+        if consumer.exception() is not None:
+            raise consumer.exception()
+        # Batches that arrived behind the sentinel are handled inline rather than dropped
+        while not inbox.empty():
+            await self._handle_batch(inbox.get_nowait())
 
     async def send_message(self, receiver_id: str, message_type: MessageType, content: Dict[str, Any]) -> None:
         if not self.orchestrator:
@@ -44,9 +71,67 @@ class A2AAgent:
         message = A2AMessage(self.agent_id, receiver_id, message_type, content)
         await self.orchestrator.deliver_message(message)
 
+    async def send_fast(self, receiver_id: str, message_type: MessageType, content: Dict[str, Any]) -> None:
+        """In-process send that skips building an A2AMessage when the receiver is not started.
+
+        A started receiver gets the message through its inbox, so it stays ordered
+        with send_message/send_messages.
+        """
+        if not self.orchestrator:
+            raise RuntimeError('Agent not registered with orchestrator')
+        await self.orchestrator.deliver(self.agent_id, receiver_id, message_type, content)
+
+    async def send_messages(self, receiver_id: str, message_type: MessageType,
+                            contents: List[Dict[str, Any]]) -> None:
+        """Send several messages to one receiver as a single batched delivery."""
+        if not self.orchestrator:
+            raise RuntimeError('Agent not registered with orchestrator')
+        messages = [A2AMessage(self.agent_id, receiver_id, message_type, c) for c in contents]
+        await self.orchestrator.deliver_batch(receiver_id, messages)
+
+    async def receive_batch(self, messages: List[A2AMessage]) -> None:
+        if self._inbox is None:
+            # Not started: there is no consumer, so hand the messages over inline
+            for message in messages:
+                await self.receive_message(message)
+        else:
+            self._inbox.put_nowait(messages)
+
+    async def _drain_inbox(self) -> None:
+        inbox = self._inbox
+        while True:
+            batches = [await inbox.get()]
+            # Take every batch already queued so a burst is handled in one pass,
+            # leaving anything behind the stop sentinel in the queue
+            while batches[-1] is not None and not inbox.empty():
+                batches.append(inbox.get_nowait())
+            try:
+                for batch in batches:
+                    if batch is None:
+                        return
+                    await self._handle_batch(batch)
+            finally:
+                # Runs even if a handler raises a BaseException, so join() never hangs
+                for _ in batches:
+                    inbox.task_done()
+
+    async def _handle_batch(self, batch: List[A2AMessage]) -> None:
+        for message in batch:
+            try:
+                await self.receive_message(message)
+            except Exception:
+                # There is no sender to raise to; log and keep draining
+                logger.exception("Agent %s failed to handle message from %s",
+                                 self.agent_id, message.sender)
+
     async def receive_message(self, message: A2AMessage) -> None:
-        # Default implementation just logs; tests patch this method
-        await asyncio.sleep(0)
+        # Default implementation is a no-op; tests patch this method
+        pass
+
+    async def receive_message_fast(self, sender: str, message_type: MessageType, content: Dict[str, Any]) -> None:
+        # Flattened counterpart of receive_message for in-process delivery; agents that
+        # override it skip the A2AMessage allocation, all others see a regular message
+        await self.receive_message(A2AMessage(sender, self.agent_id, message_type, content))
 
 class A2AOrchestrator:
     def __init__(self) -> None:
@@ -58,13 +143,28 @@ class A2AOrchestrator:
         # connect peers
         for other in self.agents.values():
             if other.agent_id != agent.agent_id:
-                if agent.agent_id not in other.peers:
-                    other.peers.append(agent.agent_id)
-                if other.agent_id not in agent.peers:
-                    agent.peers.append(other.agent_id)
+                other.peers.add(agent.agent_id)
+                agent.peers.add(other.agent_id)
 
     async def deliver_message(self, message: A2AMessage) -> None:
         receiver = self.agents.get(message.receiver)
         if receiver:
-            await receiver.receive_message(message)
+            # Share the batch path so single and batched sends stay in order
+            await receiver.receive_batch([message])
+
+    async def deliver_batch(self, receiver_id: str, messages: List[A2AMessage]) -> None:
+        receiver = self.agents.get(receiver_id)
+        if receiver:
+            await receiver.receive_batch(messages)
+
+    async def deliver(self, sender: str, receiver_id: str, message_type: MessageType,
+                      content: Dict[str, Any]) -> None:
+        receiver = self.agents.get(receiver_id)
+        if receiver is None:
+            return
+        if receiver._inbox is not None:
+            # A started receiver orders every delivery through its inbox
+            await receiver.receive_batch([A2AMessage(sender, receiver_id, message_type, content)])
+        else:
+            await receiver.receive_message_fast(sender, message_type, content)
 
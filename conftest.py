@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Test modules import the top-level project modules; add the repository root
+# once per session here rather than with a sys.path.insert in every file.
+_ROOT = str(Path(__file__).resolve().parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture(scope='session')
+def orchestrator():
+    from services.ai_providers_simple import orchestrator
+    return orchestrator
@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 from refactored_orchestrator import EnhancedOrchestrator
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopRecord:
     name: str
     result: Dict[str, Any]
@@ -20,18 +20,16 @@ class ExtendedAutonomousPipeline:
         self.agents = agents
         self.history: List[LoopRecord] = []
 
-    async def requirement_extraction(self, raw_input: str) -> Dict[str, Any]:
+    async def requirement_extraction(self, raw_input: str) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="requirement_extraction",
             paradigm="analysis",
             task=raw_input,
             agents=self.agents,
         )
-        backlog = {"stories": [raw_input], "criteria": []}
-        self.history.append(LoopRecord("requirement_extraction", backlog))
-        return backlog
+        return LoopRecord("requirement_extraction", {"stories": [raw_input], "criteria": []})
 
-    async def architecture_synthesis(self, backlog: Dict[str, Any]) -> Dict[str, Any]:
+    async def architecture_synthesis(self, backlog: Dict[str, Any]) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="architecture_synthesis",
             paradigm="design",
@@ -39,11 +37,9 @@ class ExtendedAutonomousPipeline:
             agents=self.agents,
             context=backlog,
         )
-        design = {"modules": [], "interactions": [], "infra": {}}
-        self.history.append(LoopRecord("architecture_synthesis", design))
-        return design
+        return LoopRecord("architecture_synthesis", {"modules": [], "interactions": [], "infra": {}})
 
-    async def code_generation(self, design: Dict[str, Any]) -> Dict[str, Any]:
+    async def code_generation(self, design: Dict[str, Any]) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="code_generation",
             paradigm="implementation",
@@ -51,11 +47,9 @@ class ExtendedAutonomousPipeline:
             agents=self.agents,
             context=design,
         )
-        code = {"services": []}
-        self.history.append(LoopRecord("code_generation", code))
-        return code
+        return LoopRecord("code_generation", {"services": []})
 
-    async def automated_testing(self, code: Dict[str, Any]) -> Dict[str, Any]:
+    async def automated_testing(self, code: Dict[str, Any]) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="automated_testing",
             paradigm="testing",
@@ -63,11 +57,9 @@ class ExtendedAutonomousPipeline:
             agents=self.agents,
             context=code,
         )
-        results = {"coverage": 0.0}
-        self.history.append(LoopRecord("automated_testing", results))
-        return results
+        return LoopRecord("automated_testing", {"coverage": 0.0})
 
-    async def code_review(self, code: Dict[str, Any]) -> Dict[str, Any]:
+    async def code_review(self, code: Dict[str, Any]) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="code_review",
             paradigm="review",
@@ -75,50 +67,50 @@ class ExtendedAutonomousPipeline:
             agents=self.agents,
             context=code,
         )
-        review = {"issues": []}
-        self.history.append(LoopRecord("code_review", review))
-        return review
+        return LoopRecord("code_review", {"issues": []})
 
-    async def deployment_orchestration(self) -> Dict[str, Any]:
+    async def deployment_orchestration(self) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="deployment_orchestration",
             paradigm="deployment",
             task="deploy",
             agents=self.agents,
         )
-        deployment = {"status": "ok"}
-        self.history.append(LoopRecord("deployment_orchestration", deployment))
-        return deployment
+        return LoopRecord("deployment_orchestration", {"status": "ok"})
 
-    async def monitoring(self) -> Dict[str, Any]:
+    async def monitoring(self) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="monitoring",
             paradigm="observability",
             task="monitor",
             agents=self.agents,
         )
-        metrics = {"alerts": 0}
-        self.history.append(LoopRecord("monitoring", metrics))
-        return metrics
+        return LoopRecord("monitoring", {"alerts": 0})
 
-    async def metrics_feedback(self) -> Dict[str, Any]:
+    async def metrics_feedback(self) -> LoopRecord:
         await self.orchestrator.collaborate(
             session_id="metrics_feedback",
             paradigm="feedback",
             task="retrain",
             agents=self.agents,
         )
-        summary = {"improved": True}
-        self.history.append(LoopRecord("metrics_feedback", summary))
-        return summary
+        return LoopRecord("metrics_feedback", {"improved": True})
 
     async def run_pipeline(self, raw_input: str) -> List[LoopRecord]:
         backlog = await self.requirement_extraction(raw_input)
-        design = await self.architecture_synthesis(backlog)
-        code = await self.code_generation(design)
-        await self.automated_testing(code)
-        await self.code_review(code)
-        await self.deployment_orchestration()
-        await self.monitoring()
-        await self.metrics_feedback()
+        self.history.append(backlog)
+        design = await self.architecture_synthesis(backlog.result)
+        self.history.append(design)
+        code = await self.code_generation(design.result)
+        self.history.append(code)
+        # Independent stages run concurrently; gather returns records in the order given
+        self.history.extend(await asyncio.gather(
+            self.automated_testing(code.result),
+            self.code_review(code.result),
+        ))
+        self.history.extend(await asyncio.gather(
+            self.deployment_orchestration(),
+            self.monitoring(),
+            self.metrics_feedback(),
+        ))
         return self.history
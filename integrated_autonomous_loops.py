@@ -10,17 +10,32 @@ class IntegratedAutonomousLoops:
         self.agents = agents
         self.performance_history: List[Dict[str, Any]] = []
 
-    async def run_all_loops(self, task: str, iterations: int = 1, delay_seconds: int = 0) -> None:
-        for _ in range(iterations):
-            sd_result = await self.orchestrator.collaborate(
-                session_id='sd', paradigm='self-directed', task=task, agents=self.agents
-            )
-            feedback_result = f"feedback for {task}"
-            optimization_result = f"optimization for {task}"
-            self.performance_history.append({
-                'sd_result': sd_result,
-                'feedback_result': feedback_result,
-                'optimization_result': optimization_result,
-            })
-            if delay_seconds:
+    def _record(self, task: str, sd_result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'sd_result': sd_result,
+            'feedback_result': f"feedback for {task}",
+            'optimization_result': f"optimization for {task}",
+        }
+
+    async def run_all_loops(self, task: str, iterations: int = 1, delay_seconds: int = 0,
+                            concurrency: int = 16) -> None:
+        if delay_seconds:
+            # A delay implies paced, sequential iterations
+            for _ in range(iterations):
+                sd_result = await self.orchestrator.collaborate(
+                    session_id='sd', paradigm='self-directed', task=task, agents=self.agents
+                )
+                self.performance_history.append(self._record(task, sd_result))
                 await asyncio.sleep(delay_seconds)
+            return
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one() -> Dict[str, Any]:
+            async with sem:
+                return await self.orchestrator.collaborate(
+                    session_id='sd', paradigm='self-directed', task=task, agents=self.agents
+                )
+
+        results = await asyncio.gather(*[_one() for _ in range(iterations)])
+        self.performance_history.extend(self._record(task, r) for r in results)
@@ -1,19 +1,17 @@
-import asyncio
+from types import MappingProxyType
 from typing import List, Dict, Any
 
 class EnhancedOrchestrator:
     """Simplified orchestrator used for tests."""
+    _PROVIDERS = MappingProxyType({
+        name: MappingProxyType({}) for name in ('gemini', 'claude', 'openai', 'blackbox')
+    })
+
     def __init__(self) -> None:
-        self.providers = {
-            'gemini': {},
-            'claude': {},
-            'openai': {},
-            'blackbox': {},
-        }
+        self.providers = self._PROVIDERS
 
     async def collaborate(self, session_id: str, paradigm: str, task: str,
                           agents: List[str], context: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        await asyncio.sleep(0)
         return {
             'success': True,
             'paradigm': paradigm,
@@ -25,5 +23,4 @@ class EnhancedOrchestrator:
 enhanced_orchestrator = EnhancedOrchestrator()
 
 async def enter_autonomous_sdlc_mode(task: str, agents: List[str]) -> str:
-    await asyncio.sleep(0)
     return f"completed {task} with {', '.join(agents)}"
@@ -1,14 +1,27 @@
 import asyncio
-from typing import List
+from typing import Any, Awaitable, Callable, List
 
 from refactored_orchestrator import enter_autonomous_sdlc_mode
 
-async def autonomous_sdlc_loop(task: str, agents: List[str], *, iterations: int = 1, delay_seconds: int = 0):
-    for _ in range(iterations):
-        try:
-            await enter_autonomous_sdlc_mode(task, agents)
-        except Exception:
-            # swallow exceptions to allow loop to continue
-            pass
-        if delay_seconds:
-            await asyncio.sleep(delay_seconds)
+async def autonomous_sdlc_loop(task: str, agents: List[str], *, iterations: int = 1, delay_seconds: int = 0,
+                               concurrency: int = 16,
+                               sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep):
+    if delay_seconds:
+        # A delay implies paced, sequential iterations
+        for _ in range(iterations):
+            try:
+                await enter_autonomous_sdlc_mode(task, agents)
+            except Exception:
+                # swallow exceptions to allow loop to continue
+                pass
+            await sleep(delay_seconds)
+        return
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one():
+        async with sem:
+            return await enter_autonomous_sdlc_mode(task, agents)
+
+    # return_exceptions keeps one failed iteration from cancelling the rest
+    await asyncio.gather(*[_one() for _ in range(iterations)], return_exceptions=True)
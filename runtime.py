@@ -0,0 +1,27 @@
+"""Event-loop setup shared by the pipeline entry points.
+
+Importing this module has no side effects. Scripts call ``run(main())`` from
+their ``__main__`` block to execute on uvloop (winloop on Windows) when that
+package is installed, and on the stdlib loop otherwise.
+"""
+import asyncio
+import sys
+from typing import Any, Callable, Coroutine, Optional
+
+
+def fast_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return the libuv-backed loop constructor if available, else None for the stdlib loop."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return None
+    return loop_impl.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Like asyncio.run, but on the fast loop when one is installed."""
+    with asyncio.Runner(loop_factory=fast_loop_factory()) as runner:
+        return runner.run(main)
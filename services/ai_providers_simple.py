@@ -1,35 +1,62 @@
-import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Provider:
     name: str
 
+async def _canned_collaboration(paradigm: str, task: str, agents: List[str],
+                                context: Dict[str, Any] | None) -> Dict[str, Any]:
+    return {
+        'success': True,
+        'paradigm': paradigm,
+        'task': task,
+        'agents': agents,
+        'status': 'ok',
+    }
+
+# One O(1) lookup per call; register a new paradigm here instead of branching in collaborate
+_PARADIGM_HANDLERS: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    'orchestra': _canned_collaboration,
+    'mesh': _canned_collaboration,
+    'swarm': _canned_collaboration,
+    'weaver': _canned_collaboration,
+    'ecosystem': _canned_collaboration,
+}
+
 class SimpleOrchestrator:
     """Minimal orchestrator used for unit tests."""
+    # Providers are static, so every instance shares one read-only registry
+    _PROVIDERS: Mapping[str, Provider] = MappingProxyType({
+        'gemini': Provider('gemini'),
+        'claude': Provider('claude'),
+        'openai': Provider('openai'),
+        'blackbox': Provider('blackbox'),
+    })
+
     def __init__(self) -> None:
-        self.providers: Dict[str, Provider] = {
-            'gemini': Provider('gemini'),
-            'claude': Provider('claude'),
-            'openai': Provider('openai'),
-            'blackbox': Provider('blackbox'),
-        }
+        self.providers = self._PROVIDERS
         self.active_sessions: Dict[str, Any] = {}
         self.bridge_initialized = False
 
     async def collaborate(self, session_id: str, paradigm: str, task: str,
                           agents: List[str], context: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Return a canned response used by the tests."""
-        await asyncio.sleep(0)  # allow scheduling
+        handler = _PARADIGM_HANDLERS.get(paradigm)
+        if handler is None:
+            # Same keys as a successful result, so callers can read any field on either path
+            return {
+                'success': False,
+                'paradigm': paradigm,
+                'task': task,
+                'agents': agents,
+                'status': 'error',
+                'error': f"Unknown paradigm: {paradigm}",
+            }
         self.active_sessions[session_id] = task
-        return {
-            'success': True,
-            'paradigm': paradigm,
-            'task': task,
-            'agents': agents,
-            'status': 'ok',
-        }
+        return await handler(paradigm, task, agents, context)
 
     async def initialize_bridges(self) -> Dict[str, Any]:
         self.bridge_initialized = True
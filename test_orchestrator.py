@@ -4,18 +4,11 @@ Test script to demonstrate SDLC Orchestrator functionality
 """
 import asyncio
 import json
-import sys
-import os
 import logging
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from services.ai_providers_simple import orchestrator
-
 logger = logging.getLogger(__name__)
 
-async def _async_test_orchestrator():
+async def _async_test_orchestrator(orchestrator):
     """Test the SDLC orchestrator with different collaboration paradigms"""
 
     logger.info("SDLC Orchestrator Test Suite")
@@ -32,13 +25,13 @@ async def _async_test_orchestrator():
         'weaver',
         'ecosystem'
     ]
+    session_ids = [f"test_{paradigm}" for paradigm in paradigms]
 
-    for paradigm in paradigms:
+    for paradigm, session_id in zip(paradigms, session_ids):
         logger.info(f"\nTesting {paradigm.upper()} Paradigm")
         logger.info("-" * 40)
 
         try:
-            session_id = f"test_{paradigm}"
             result = await orchestrator.collaborate(
                 session_id=session_id,
                 paradigm=paradigm,
@@ -89,11 +82,14 @@ async def _async_test_orchestrator():
     logger.info(f"Available Providers: {list(orchestrator.providers.keys())}")
     logger.info(f"Bridge Enhanced: {orchestrator.bridge_initialized}")
 
-def test_orchestrator():
-    asyncio.run(_async_test_orchestrator())
+def test_orchestrator(orchestrator):
+    asyncio.run(_async_test_orchestrator(orchestrator))
 
 
 if __name__ == "__main__":
+    import runtime
+    from services.ai_providers_simple import orchestrator
+
     logger.info("Starting SDLC Orchestrator Test...")
-    asyncio.run(_async_test_orchestrator())
+    runtime.run(_async_test_orchestrator(orchestrator))
     logger.info("\nTest Complete!")
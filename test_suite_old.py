@@ -4,29 +4,23 @@ Comprehensive test suite for SDLC Orchestrator
 Tests functionality, debugs issues, and validates improvements
 """
 import asyncio
-import sys
 import os
 import time
 import json
 import logging
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
 from contextlib import asynccontextmanager
 
-# Add src to path
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
 class TestResult:
     """TestResult class for steampunk operations."""
-    """  Init   with enhanced functionality."""
-    def __init__(self, name: str, passed: bool, error: str = None, duration: float = 0):
-        self.name = name
-        self.passed = passed
-        self.error = error
-        self.duration = duration
+    name: str
+    passed: bool
+    error: Optional[str] = None
+    duration: float = 0
 
 """  Init   with enhanced functionality."""
 """TestSuite class for steampunk operations."""
@@ -177,9 +171,19 @@ async def run_frontend_structure():
         "components/IdeationView.tsx"
     ]
 
+    # One directory listing per parent instead of one stat per file
+    present = set()
+    for directory in {os.path.dirname(p) for p in frontend_files}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                present.update(os.path.join(directory, e.name) for e in entries)
+        except OSError:
+            # Missing, not a directory or unreadable: its files count as absent, as os.path.exists did
+            pass
+
     for file_path in frontend_files:
         async with suite.test_case(f"Frontend File: {file_path}"):
-            assert os.path.exists(file_path), f"File {file_path} does not exist"
+            assert file_path in present, f"File {file_path} does not exist"
 
     return suite
 
@@ -248,4 +252,6 @@ async def main():
                 logger.info(f"    Error: {result.error}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import runtime
+
+    runtime.run(main())
@@ -1,8 +1,30 @@
+import hashlib
+import itertools
+import json
 import os
 import subprocess
 import asyncio
-import time
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+# Directories that never contain project sources worth generating tests for
+_SKIP_DIRS = frozenset({
+    '.git', '.venv', 'venv', 'site-packages', '__pycache__', 'node_modules', 'build', 'dist',
+})
+
+_STUB_CACHE_SIZE = 4096
+
+def _load_json_report(path: str) -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 class TestingLoopRunner:
     """TestingLoopRunner class for steampunk operations."""
@@ -12,46 +34,91 @@ class TestingLoopRunner:
         self.agents = agents
         self.project_root = project_root
         self.test_results = []
+        # source path -> (content digest, generated stub), reused across loop runs
+        self._stub_cache: Dict[str, Tuple[str, str]] = {}
+        # Monotonic ids stay unique even for calls made within the same second
+        self._testgen_ids = itertools.count()
+
+    @staticmethod
+    def _source_digest(source_file: str) -> Optional[str]:
+        try:
+            with open(source_file, "rb") as f:
+                return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        except OSError:
+            return None
 
     def inspect_file_structure(self) -> List[str]:
         """
         Inspect the project directory to find source files for test generation.
+        Hidden and build/vendor directories are pruned without being entered.
         """
         source_files = []
-        for root, _, files in os.walk(self.project_root):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("test_"):
-                    source_files.append(os.path.join(root, file))
+        stack = [self.project_root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in _SKIP_DIRS and not name.startswith("."):
+                                stack.append(entry.path)
+                        elif name.endswith(".py") and not name.startswith("test_"):
+                            source_files.append(entry.path)
+            except OSError:
+                # Unreadable or vanished directories are skipped, as os.walk does
+                continue
         return source_files
 
-    async def generate_test_stubs(self, source_files: List[str]) -> Dict[str, str]:
+    async def generate_test_stubs(self, source_files: List[str], concurrency: int = 16) -> Dict[str, str]:
         """
         Generate pytest/unittest stubs for the given source files using AI.
         Returns a dict mapping source file to generated test code.
+        At most ``concurrency`` orchestrator calls are in flight at once, and
+        files whose content is unchanged since a previous call reuse the cached stub.
         """
-        test_stubs = {}
-        for source_file in source_files:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _gen(source_file: str):
+            # Reading and hashing is blocking file I/O; keep it off the event loop
+            digest = await asyncio.to_thread(self._source_digest, source_file)
+            cached = self._stub_cache.get(source_file)
+            if digest and cached is not None and cached[0] == digest:
+                return source_file, cached[1]
             prompt = f"Generate pytest test stubs for the Python source file: {source_file}."
             # Call orchestrator to generate test code
-            response = await self.orchestrator.collaborate(
-                session_id=f"testgen_{int(time.time())}",
-                paradigm='orchestra',
-                task=prompt,
-                agents=self.agents,
-                context={'mode': 'test_generation'}
-            )
+            async with sem:
+                response = await self.orchestrator.collaborate(
+                    session_id=f"testgen_{next(self._testgen_ids)}",
+                    paradigm='orchestra',
+                    task=prompt,
+                    agents=self.agents,
+                    context={'mode': 'test_generation'}
+                )
             test_code = response.get('synthesis', {}).get('key_insights', [])
-            if test_code:
-                test_stubs[source_file] = "\n".join(test_code)
-            else:
-                test_stubs[source_file] = "# Test generation failed or returned empty."
-        return test_stubs
+            if not test_code:
+                return source_file, "# Test generation failed or returned empty."
+            stub = "\n".join(test_code)
+            if digest:
+                # One entry per path, so an edited file replaces its stale stub
+                self._stub_cache.pop(source_file, None)
+                if len(self._stub_cache) >= _STUB_CACHE_SIZE:
+                    # Evict the oldest entry; dicts preserve insertion order
+                    del self._stub_cache[next(iter(self._stub_cache))]
+                self._stub_cache[source_file] = (digest, stub)
+            return source_file, stub
+
+        return dict(await asyncio.gather(*[_gen(sf) for sf in source_files]))
 
     def write_test_files(self, test_stubs: Dict[str, str]):
         """
         Write generated test stubs to test files in the project.
+        Files are independent, so writes are spread across a thread pool.
         """
-        for source_file, test_code in test_stubs.items():
+        if not test_stubs:
+            return
+
+        def _write(item):
+            source_file, test_code = item
             test_file = os.path.join(
                 os.path.dirname(source_file),
                 f"test_{os.path.basename(source_file)}"
@@ -59,20 +126,25 @@ class TestingLoopRunner:
             with open(test_file, "w", encoding="utf-8") as f:
                 f.write(test_code)
 
+        with ThreadPoolExecutor(max_workers=min(32, len(test_stubs))) as executor:
+            # list() drains the iterator so any write error is raised here
+            list(executor.map(_write, test_stubs.items()))
+
     def run_tests(self) -> Dict[str, Any]:
         """
         Run tests using pytest and gather results.
+        The JSON report is stored parsed, so consumers never re-decode it.
         """
         try:
             result = subprocess.run(
-                ["pytest", "--json-report", "--json-report-file=report.json"],
+                ["pytest", "--json-report", "--json-report-file=report.json",
+                 "--json-report-omit", "collectors", "log"],
                 cwd=self.project_root,
                 capture_output=True,
                 text=True,
                 check=True
             )
-            with open(os.path.join(self.project_root, "report.json"), "r", encoding="utf-8") as f:
-                report = f.read()
+            report = _load_json_report(os.path.join(self.project_root, "report.json"))
             self.test_results.append({
                 "success": True,
                 "output": result.stdout,
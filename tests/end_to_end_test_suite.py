@@ -6,12 +6,17 @@ Tests all components of the Steampunk A2A MCP Integration Framework
 
 import asyncio
 import json
+import re
 import time
 import os
 import sys
 import unittest
 import logging
-from datetime import datetime
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from importlib import import_module
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import tempfile
@@ -20,6 +25,13 @@ import subprocess
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:  # optional; stdlib json produces the same document
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,15 +39,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def cached_import(module_path: str, attr: str):
+    """Return ``module_path.attr``, consulting sys.modules before the import machinery"""
+    module = sys.modules.get(module_path)
+    spec = getattr(module, '__spec__', None)
+    if module is None or (spec is not None and getattr(spec, '_initializing', False)):
+        module = import_module(module_path)
+    return getattr(module, attr)
+
+@lru_cache(maxsize=None)
+def _read_text(path: str) -> str:
+    """Read a static asset once per process; validators re-entering the suite reuse it"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+_REQUIRED_FILES = (
+    'styles/steampunk.css',
+    'components/SteampunkFileUpload.tsx',
+    'components/SteampunkChatInterface.tsx',
+    'components/SteampunkGitHubIntegration.tsx',
+    'components/SteampunkAgentDevelopment.tsx',
+    'components/SteampunkApp.tsx',
+    'src/services/bridges/mcp_bridge.py',
+    'src/services/bridges/bridge_manager.py',
+    'src/services/bridges/github_codex_bridge.py',
+    'a2a_mcp_coordinator.py',
+    'refactored_orchestrator.py'
+)
+
+def _group_by_dir(paths) -> Dict[str, List[str]]:
+    by_dir = defaultdict(list)
+    for file_path in paths:
+        directory, name = os.path.split(file_path)
+        by_dir[directory].append(name)
+    return dict(by_dir)
+
+# Parent directory -> required names, so each directory is listed once per check
+_REQUIRED_FILES_BY_DIR = _group_by_dir(_REQUIRED_FILES)
+
+_IMPORT_TESTS = (
+    ('src.services.bridges.mcp_bridge', 'mcp_bridge'),
+    ('src.services.bridges.bridge_manager', 'bridge_manager'),
+    ('src.services.bridges.github_codex_bridge', 'github_codex_bridge'),
+)
+
+_CSS_FILE = 'styles/steampunk.css'
+_TSX_FILES = (
+    'components/SteampunkFileUpload.tsx',
+    'components/SteampunkChatInterface.tsx',
+    'components/SteampunkGitHubIntegration.tsx',
+    'components/SteampunkAgentDevelopment.tsx',
+    'components/SteampunkApp.tsx'
+)
+
+_EXPECTED_SERVERS = frozenset({'perplexity', 'notion', 'eslint', 'deepseek', 'jenkins'})
+_EXPECTED_PROVIDERS = frozenset({'gemini', 'claude', 'openai', 'blackbox'})
+
+_CSS_REQUIRED_VARS = ('--brass-primary', '--copper', '--steel-blue', '--antique-white')
+# One findall per file tallies braces and the tokens we look for in a single scan
+_CSS_TOKENS_RE = re.compile('[{}]|' + '|'.join(map(re.escape, _CSS_REQUIRED_VARS)))
+_TSX_TOKENS_RE = re.compile(r'[{}]|export')
+_LEADING_IMPORT_RE = re.compile(r'\s*import')
+
+def _scan_tsx(tsx_file: str) -> List[str]:
+    """Return the basic syntax errors found in one TSX file"""
+    errors = []
+    try:
+        content = _read_text(tsx_file)
+
+        # Basic syntax checks
+        if not _LEADING_IMPORT_RE.match(content):
+            errors.append(f"{tsx_file}: Missing imports")
+
+        tokens = Counter(_TSX_TOKENS_RE.findall(content))
+        if not tokens['export']:
+            errors.append(f"{tsx_file}: Missing export")
+
+        if tokens['{'] != tokens['}']:
+            errors.append(f"{tsx_file}: Mismatched braces")
+
+    except Exception as e:
+        errors.append(f"{tsx_file}: {str(e)}")
+    return errors
+
+def _missing_attrs(obj, names) -> List[str]:
+    """Return the names not present on obj, checking its field table before attribute lookup"""
+    if is_dataclass(obj):
+        present = {f.name for f in fields(obj)}
+    else:
+        present = getattr(obj, '__dict__', {})
+    # Only names absent from the instance fields pay for hasattr (properties, class attributes)
+    return [name for name in names if name not in present and not hasattr(obj, name)]
+
+class _Timer:
+    """Measure the wall time of a block with the monotonic nanosecond counter"""
+    __slots__ = ('_start', 'elapsed')
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        # Set even when the block raises, so failed tests still report a duration
+        self.elapsed = (time.perf_counter_ns() - self._start) / 1e9
+
+@dataclass(slots=True)
 class TestResult:
     """TestResult class for steampunk operations."""
-    """  Init   with enhanced functionality."""
-    def __init__(self, test_name: str, success: bool, details: str = "", duration: float = 0.0):
-        self.test_name = test_name
-        self.success = success
-        self.details = details
-        self.duration = duration
-        self.timestamp = datetime.now()
+    test_name: str
+    success: bool
+    details: str = ""
+    duration: float = 0.0
+    # Raw epoch nanoseconds; formatted to ISO only when a report is written
+    timestamp_ns: int = field(default_factory=time.time_ns, init=False)
 
 class EndToEndTestSuite:
     """Comprehensive test suite for the entire system"""
@@ -46,106 +162,157 @@ class EndToEndTestSuite:
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self._duration_sum = 0.0
         self.start_time = time.time()
+        # Serializes counter updates when tests complete concurrently
+        self._results_lock = asyncio.Lock()
+        # Per-result log lines, written as one record when a group is recorded
+        self._log_buf: List[str] = []
+        self._preload_targets()
+
+    # Attribute name -> (module, object) for every system under test
+    _TARGETS = {
+        'mcp_bridge': ('src.services.bridges.mcp_bridge', 'mcp_bridge'),
+        'bridge_manager': ('src.services.bridges.bridge_manager', 'bridge_manager'),
+        'BridgeType': ('src.services.bridges.bridge_manager', 'BridgeType'),
+        'TaskType': ('src.services.bridges.bridge_manager', 'TaskType'),
+        'a2a': ('a2a_mcp_coordinator', 'a2a_mcp_coordinator'),
+        'AgentRole': ('a2a_mcp_coordinator', 'AgentRole'),
+        'orchestrator': ('refactored_orchestrator', 'enhanced_orchestrator'),
+    }
+
+    def _preload_targets(self):
+        """Import every test target once so tests skip the import lock entirely"""
+        self._import_errors: Dict[str, Exception] = {}
+        for attr, (module_path, object_name) in self._TARGETS.items():
+            try:
+                setattr(self, attr, cached_import(module_path, object_name))
+            except Exception as e:
+                self._import_errors[attr] = e
+
+    def __getattr__(self, name):
+        # Only reached for targets that failed to preload: surface the original
+        # import error inside the test that needs it, as the inline imports did
+        error = self.__dict__.get('_import_errors', {}).get(name)
+        if error is not None:
+            raise error
+        raise AttributeError(name)
 
     def add_result(self, result: TestResult):
         """Add a test result and update counters"""
         self.test_results.append(result)
         self.total_tests += 1
+        self._duration_sum += result.duration
         if result.success:
             self.passed_tests += 1
         else:
             self.failed_tests += 1
 
+        if not logger.isEnabledFor(logging.INFO):
+            return
         status = "✅ PASS" if result.success else "❌ FAIL"
-        logger.info(f"   {status} {result.test_name} ({result.duration:.3f}s)")
+        self._log_buf.append(f"   {status} {result.test_name} ({result.duration:.3f}s)")
         if not result.success and result.details:
-            logger.info(f"        Details: {result.details}")
-
-    async def run_test(self, test_name: str, test_func, *args, **kwargs) -> TestResult:
-        """Run a single test with timing and error handling"""
-        start_time = time.time()
+            self._log_buf.append(f"        Details: {result.details}")
+
+    def flush_log(self):
+        """Emit buffered result lines with a single logger call"""
+        if self._log_buf:
+            logger.info("%s", "\n".join(self._log_buf))
+            self._log_buf.clear()
+
+    async def _record(self, results: List[TestResult]):
+        async with self._results_lock:
+            for result in results:
+                self.add_result(result)
+            self.flush_log()
+
+    async def _execute_test(self, test_name: str, test_func, *args, **kwargs) -> TestResult:
+        """Time a single test and capture its outcome without recording it"""
+        timer = _Timer()
         try:
-            if asyncio.iscoroutinefunction(test_func):
-                success, details = await test_func(*args, **kwargs)
-            else:
-                success, details = test_func(*args, **kwargs)
+            with timer:
+                if asyncio.iscoroutinefunction(test_func):
+                    success, details = await test_func(*args, **kwargs)
+                else:
+                    # Blocking file/import checks run in a worker thread so a group can overlap them
+                    success, details = await asyncio.to_thread(test_func, *args, **kwargs)
 
-            duration = time.time() - start_time
-            result = TestResult(test_name, success, details, duration)
-            self.add_result(result)
-            return result
+            return TestResult(test_name, success, details, timer.elapsed)
 
         except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult(test_name, False, f"Exception: {str(e)}", duration)
-            self.add_result(result)
-            return result
+            return TestResult(test_name, False, f"Exception: {str(e)}", timer.elapsed)
+
+    async def run_test(self, test_name: str, test_func, *args, **kwargs) -> TestResult:
+        """Run a single test with timing and error handling"""
+        result = await self._execute_test(test_name, test_func, *args, **kwargs)
+        await self._record([result])
+        return result
+
+    async def run_test_group(self, tests: List[tuple]) -> List[TestResult]:
+        """Run independent tests concurrently, recording results in declaration order"""
+        results = await asyncio.gather(*(self._execute_test(name, func) for name, func in tests))
+        await self._record(results)
+        return list(results)
+
+    async def run_dependent_group(self, tests: List[tuple], passed: set) -> List[TestResult]:
+        """Run (name, func, prerequisite) tests concurrently, failing those whose prerequisite did not pass"""
+        runnable = [(name, func) for name, func, prerequisite in tests if prerequisite in passed]
+        executed = iter(await asyncio.gather(*(self._execute_test(name, func) for name, func in runnable)))
+        results = [
+            next(executed) if prerequisite in passed
+            else TestResult(name, False, f"Skipped: prerequisite '{prerequisite}' failed")
+            for name, _, prerequisite in tests
+        ]
+        await self._record(results)
+        return results
 
     # ========== INFRASTRUCTURE TESTS ==========
 
     def test_file_structure(self) -> tuple[bool, str]:
         """Test that all required files exist"""
-        required_files = [
-            'styles/steampunk.css',
-            'components/SteampunkFileUpload.tsx',
-            'components/SteampunkChatInterface.tsx',
-            'components/SteampunkGitHubIntegration.tsx',
-            'components/SteampunkAgentDevelopment.tsx',
-            'components/SteampunkApp.tsx',
-            'src/services/bridges/mcp_bridge.py',
-            'src/services/bridges/bridge_manager.py',
-            'src/services/bridges/github_codex_bridge.py',
-            'a2a_mcp_coordinator.py',
-            'refactored_orchestrator.py'
-        ]
-
         missing_files = []
-        for file_path in required_files:
-            if not os.path.exists(file_path):
-                missing_files.append(file_path)
+        for directory, names in _REQUIRED_FILES_BY_DIR.items():
+            try:
+                with os.scandir(directory or '.') as entries:
+                    present = {entry.name for entry in entries}
+            except OSError:
+                present = set()
+            missing_files.extend(os.path.join(directory, n) for n in names if n not in present)
 
-        if missing_files:
-            return False, f"Missing files: {', '.join(missing_files)}"
-        return True, f"All {len(required_files)} required files present"
+        return (not missing_files,
+                f"Missing files: {', '.join(missing_files)}" if missing_files
+                else f"All {len(_REQUIRED_FILES)} required files present")
 
     def test_python_imports(self) -> tuple[bool, str]:
         """Test that all Python modules can be imported"""
-        import_tests = [
-            ('src.services.bridges.mcp_bridge', 'mcp_bridge'),
-            ('src.services.bridges.bridge_manager', 'bridge_manager'),
-            ('src.services.bridges.github_codex_bridge', 'github_codex_bridge'),
-        ]
-
         failed_imports = []
-        for module_path, object_name in import_tests:
+        for module_path, object_name in _IMPORT_TESTS:
             try:
-                module = __import__(module_path, fromlist=[object_name])
-                getattr(module, object_name)
+                cached_import(module_path, object_name)
             except Exception as e:
                 failed_imports.append(f"{module_path}.{object_name}: {str(e)}")
 
         if failed_imports:
             return False, f"Failed imports: {'; '.join(failed_imports)}"
-        return True, f"All {len(import_tests)} imports successful"
+        return True, f"All {len(_IMPORT_TESTS)} imports successful"
 
     def test_css_syntax(self) -> tuple[bool, str]:
         """Test CSS file syntax"""
-        css_file = 'styles/steampunk.css'
         try:
-            with open(css_file, 'r') as f:
-                content = f.read()
+            content = _read_text(_CSS_FILE)
+
+            tokens = Counter(_CSS_TOKENS_RE.findall(content))
 
             # Basic CSS syntax checks
-            brace_open = content.count('{')
-            brace_close = content.count('}')
+            brace_open = tokens['{']
+            brace_close = tokens['}']
 
             if brace_open != brace_close:
                 return False, f"Mismatched braces: {brace_open} open, {brace_close} close"
 
             # Check for required CSS variables
-            required_vars = ['--brass-primary', '--copper', '--steel-blue', '--antique-white']
-            missing_vars = [var for var in required_vars if var not in content]
+            missing_vars = [var for var in _CSS_REQUIRED_VARS if not tokens[var]]
 
             if missing_vars:
                 return False, f"Missing CSS variables: {', '.join(missing_vars)}"
@@ -155,62 +322,35 @@ class EndToEndTestSuite:
         except Exception as e:
             return False, f"CSS file error: {str(e)}"
 
-    def test_tsx_syntax(self) -> tuple[bool, str]:
+    async def test_tsx_syntax(self) -> tuple[bool, str]:
         """Test TypeScript/TSX file syntax"""
-        tsx_files = [
-            'components/SteampunkFileUpload.tsx',
-            'components/SteampunkChatInterface.tsx',
-            'components/SteampunkGitHubIntegration.tsx',
-            'components/SteampunkAgentDevelopment.tsx',
-            'components/SteampunkApp.tsx'
-        ]
-
-        syntax_errors = []
-        for tsx_file in tsx_files:
-            try:
-                with open(tsx_file, 'r') as f:
-                    content = f.read()
-
-                # Basic syntax checks
-                if not content.strip().startswith('import'):
-                    syntax_errors.append(f"{tsx_file}: Missing imports")
-
-                if 'export' not in content:
-                    syntax_errors.append(f"{tsx_file}: Missing export")
-
-                if content.count('{') != content.count('}'):
-                    syntax_errors.append(f"{tsx_file}: Mismatched braces")
-
-            except Exception as e:
-                syntax_errors.append(f"{tsx_file}: {str(e)}")
+        # Each file is read and scanned in its own worker thread
+        per_file = await asyncio.gather(*[asyncio.to_thread(_scan_tsx, p) for p in _TSX_FILES])
+        syntax_errors = [error for errors in per_file for error in errors]
 
         if syntax_errors:
             return False, f"TSX syntax errors: {'; '.join(syntax_errors)}"
-        return True, f"All {len(tsx_files)} TSX files have valid syntax"
+        return True, f"All {len(_TSX_FILES)} TSX files have valid syntax"
 
     # ========== MCP BRIDGE TESTS ==========
 
     async def test_mcp_bridge_initialization(self) -> tuple[bool, str]:
         """Test MCP bridge initialization"""
         try:
-            from src.services.bridges.mcp_bridge import mcp_bridge
-
             # Test database initialization
-            if not os.path.exists(mcp_bridge.db_path):
+            if not os.path.exists(self.mcp_bridge.db_path):
                 return False, "MCP bridge database not created"
 
             # Test server discovery
-            if not mcp_bridge.servers:
+            if not self.mcp_bridge.servers:
                 return False, "No MCP servers discovered"
 
-            expected_servers = ['perplexity', 'notion', 'eslint', 'deepseek', 'jenkins']
-            found_servers = list(mcp_bridge.servers.keys())
-            missing_servers = [s for s in expected_servers if s not in found_servers]
+            missing_servers = _EXPECTED_SERVERS - self.mcp_bridge.servers.keys()
 
             if missing_servers:
-                return False, f"Missing servers: {', '.join(missing_servers)}"
+                return False, f"Missing servers: {', '.join(sorted(missing_servers))}"
 
-            return True, f"MCP bridge initialized with {len(found_servers)} servers"
+            return True, f"MCP bridge initialized with {len(self.mcp_bridge.servers)} servers"
 
         except Exception as e:
             return False, f"MCP bridge initialization failed: {str(e)}"
@@ -218,9 +358,7 @@ class EndToEndTestSuite:
     async def test_mcp_bridge_health_check(self) -> tuple[bool, str]:
         """Test MCP bridge health check functionality"""
         try:
-            from src.services.bridges.mcp_bridge import mcp_bridge
-
-            health_result = await mcp_bridge.health_check()
+            health_result = await self.mcp_bridge.health_check()
 
             if not isinstance(health_result, dict):
                 return False, "Health check did not return dict"
@@ -242,10 +380,8 @@ class EndToEndTestSuite:
     async def test_mcp_server_communication(self) -> tuple[bool, str]:
         """Test MCP server communication (simulated)"""
         try:
-            from src.services.bridges.mcp_bridge import mcp_bridge
-
             # Test research functionality
-            research_result = await mcp_bridge.research_documentation(
+            research_result = await self.mcp_bridge.research_documentation(
                 "Python testing best practices",
                 "normal"
             )
@@ -254,7 +390,7 @@ class EndToEndTestSuite:
                 return False, f"Research failed: {research_result.get('error', 'Unknown error')}"
 
             # Test API discovery
-            api_result = await mcp_bridge.discover_apis(
+            api_result = await self.mcp_bridge.discover_apis(
                 "FastAPI",
                 "REST API development"
             )
@@ -272,27 +408,25 @@ class EndToEndTestSuite:
     async def test_bridge_manager_initialization(self) -> tuple[bool, str]:
         """Test bridge manager initialization"""
         try:
-            from src.services.bridges.bridge_manager import bridge_manager, BridgeType
-
             # Check all bridges are registered
-            expected_bridges = [
-                BridgeType.CLAUDE_CODE,
-                BridgeType.GEMINI_CLI,
-                BridgeType.GITHUB_CODEX,
-                BridgeType.BLACKBOX_AI,
-                BridgeType.MCP_SERVER
-            ]
+            expected_bridges = frozenset([
+                self.BridgeType.CLAUDE_CODE,
+                self.BridgeType.GEMINI_CLI,
+                self.BridgeType.GITHUB_CODEX,
+                self.BridgeType.BLACKBOX_AI,
+                self.BridgeType.MCP_SERVER
+            ])
 
-            missing_bridges = [b for b in expected_bridges if b not in bridge_manager.bridges]
+            missing_bridges = expected_bridges.difference(self.bridge_manager.bridges)
 
             if missing_bridges:
-                return False, f"Missing bridges: {[b.value for b in missing_bridges]}"
+                return False, f"Missing bridges: {sorted(b.value for b in missing_bridges)}"
 
             # Check capabilities are defined
-            if not bridge_manager.bridge_capabilities:
+            if not self.bridge_manager.bridge_capabilities:
                 return False, "No bridge capabilities defined"
 
-            return True, f"Bridge manager initialized with {len(bridge_manager.bridges)} bridges"
+            return True, f"Bridge manager initialized with {len(self.bridge_manager.bridges)} bridges"
 
         except Exception as e:
             return False, f"Bridge manager initialization failed: {str(e)}"
@@ -300,9 +434,7 @@ class EndToEndTestSuite:
     async def test_bridge_manager_health_check(self) -> tuple[bool, str]:
         """Test bridge manager health check"""
         try:
-            from src.services.bridges.bridge_manager import bridge_manager
-
-            status = await bridge_manager.get_bridge_status()
+            status = await self.bridge_manager.get_bridge_status()
 
             required_fields = ['bridges', 'healthy_count', 'total_count', 'last_check']
             missing_fields = [f for f in required_fields if f not in status]
@@ -321,16 +453,14 @@ class EndToEndTestSuite:
     async def test_bridge_manager_task_routing(self) -> tuple[bool, str]:
         """Test bridge manager task routing"""
         try:
-            from src.services.bridges.bridge_manager import bridge_manager, TaskType
-
             # Test research task routing
-            best_bridge = await bridge_manager.get_best_bridge(TaskType.RESEARCH)
+            best_bridge = await self.bridge_manager.get_best_bridge(self.TaskType.RESEARCH)
 
             if not best_bridge:
                 return False, "No bridge found for RESEARCH task"
 
             # Test code generation task routing
-            best_bridge_code = await bridge_manager.get_best_bridge(TaskType.CODE_GENERATION)
+            best_bridge_code = await self.bridge_manager.get_best_bridge(self.TaskType.CODE_GENERATION)
 
             if not best_bridge_code:
                 return False, "No bridge found for CODE_GENERATION task"
@@ -345,27 +475,25 @@ class EndToEndTestSuite:
     async def test_a2a_coordinator_initialization(self) -> tuple[bool, str]:
         """Test A2A coordinator initialization"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator, AgentRole
-
             # Check agents are initialized
-            if not a2a_mcp_coordinator.agents:
+            if not self.a2a.agents:
                 return False, "No agents initialized"
 
-            expected_roles = [
-                AgentRole.RESEARCH_AGENT,
-                AgentRole.CODE_ANALYZER,
-                AgentRole.API_SCOUT,
-                AgentRole.KNOWLEDGE_KEEPER,
-                AgentRole.BUILD_MASTER,
-                AgentRole.QUALITY_INSPECTOR
-            ]
+            expected_roles = frozenset([
+                self.AgentRole.RESEARCH_AGENT,
+                self.AgentRole.CODE_ANALYZER,
+                self.AgentRole.API_SCOUT,
+                self.AgentRole.KNOWLEDGE_KEEPER,
+                self.AgentRole.BUILD_MASTER,
+                self.AgentRole.QUALITY_INSPECTOR
+            ])
 
-            missing_roles = [r for r in expected_roles if r not in a2a_mcp_coordinator.agents]
+            missing_roles = expected_roles.difference(self.a2a.agents)
 
             if missing_roles:
-                return False, f"Missing agent roles: {[r.value for r in missing_roles]}"
+                return False, f"Missing agent roles: {sorted(r.value for r in missing_roles)}"
 
-            return True, f"A2A coordinator initialized with {len(a2a_mcp_coordinator.agents)} agents"
+            return True, f"A2A coordinator initialized with {len(self.a2a.agents)} agents"
 
         except Exception as e:
             return False, f"A2A coordinator initialization failed: {str(e)}"
@@ -373,9 +501,7 @@ class EndToEndTestSuite:
     async def test_a2a_message_creation(self) -> tuple[bool, str]:
         """Test A2A message creation and structure"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator
-
-            message = await a2a_mcp_coordinator.create_message(
+            message = await self.a2a.create_message(
                 sender="test_client",
                 recipient="research_agent",
                 intent="research_documentation",
@@ -383,8 +509,8 @@ class EndToEndTestSuite:
                 context={'test': True}
             )
 
-            required_fields = ['id', 'sender', 'recipient', 'intent', 'data', 'context', 'timestamp']
-            missing_fields = [f for f in required_fields if not hasattr(message, f)]
+            required_fields = ('id', 'sender', 'recipient', 'intent', 'data', 'context', 'timestamp')
+            missing_fields = _missing_attrs(message, required_fields)
 
             if missing_fields:
                 return False, f"Message missing fields: {', '.join(missing_fields)}"
@@ -403,30 +529,28 @@ class EndToEndTestSuite:
     async def test_a2a_message_routing(self) -> tuple[bool, str]:
         """Test A2A message routing functionality"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator
-
             # Test research agent routing
-            message = await a2a_mcp_coordinator.create_message(
+            message = await self.a2a.create_message(
                 sender="test_client",
                 recipient="research_agent",
                 intent="research_documentation",
                 data={'query': 'FastAPI testing', 'detail_level': 'normal'}
             )
 
-            result = await a2a_mcp_coordinator.route_message(message)
+            result = await self.a2a.route_message(message)
 
             if not result.get('success'):
                 return False, f"Research routing failed: {result.get('error')}"
 
             # Test MCP server direct routing
-            mcp_message = await a2a_mcp_coordinator.create_message(
+            mcp_message = await self.a2a.create_message(
                 sender="test_client",
                 recipient="mcp_server",
                 intent="research_docs",
                 data={'query': 'API testing patterns'}
             )
 
-            mcp_result = await a2a_mcp_coordinator.route_message(mcp_message)
+            mcp_result = await self.a2a.route_message(mcp_message)
 
             if not mcp_result.get('success'):
                 return False, f"MCP routing failed: {mcp_result.get('error')}"
@@ -441,19 +565,16 @@ class EndToEndTestSuite:
     async def test_orchestrator_initialization(self) -> tuple[bool, str]:
         """Test orchestrator initialization"""
         try:
-            from refactored_orchestrator import enhanced_orchestrator
-
             # Check providers are initialized
-            if not enhanced_orchestrator.providers:
+            if not self.orchestrator.providers:
                 return False, "No AI providers initialized"
 
-            expected_providers = ['gemini', 'claude', 'openai', 'blackbox']
-            missing_providers = [p for p in expected_providers if p not in enhanced_orchestrator.providers]
+            missing_providers = _EXPECTED_PROVIDERS.difference(self.orchestrator.providers)
 
             if missing_providers:
-                return False, f"Missing providers: {', '.join(missing_providers)}"
+                return False, f"Missing providers: {', '.join(sorted(missing_providers))}"
 
-            return True, f"Orchestrator initialized with {len(enhanced_orchestrator.providers)} providers"
+            return True, f"Orchestrator initialized with {len(self.orchestrator.providers)} providers"
 
         except Exception as e:
             return False, f"Orchestrator initialization failed: {str(e)}"
@@ -461,9 +582,7 @@ class EndToEndTestSuite:
     async def test_orchestrator_collaboration(self) -> tuple[bool, str]:
         """Test orchestrator collaboration functionality"""
         try:
-            from refactored_orchestrator import enhanced_orchestrator
-
-            result = await enhanced_orchestrator.collaborate(
+            result = await self.orchestrator.collaborate(
                 session_id="test_session",
                 paradigm="mesh",
                 task="Test collaboration functionality",
@@ -490,9 +609,7 @@ class EndToEndTestSuite:
     async def test_full_workflow_integration(self) -> tuple[bool, str]:
         """Test complete workflow integration"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator
-
-            workflow_result = await a2a_mcp_coordinator.orchestrate_development_workflow({
+            workflow_result = await self.a2a.orchestrate_development_workflow({
                 'name': 'Test Integration Project',
                 'technology': 'Python',
                 'project_type': 'API',
@@ -519,22 +636,20 @@ class EndToEndTestSuite:
     async def test_response_times(self) -> tuple[bool, str]:
         """Test system response times"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator
-
             # Test message creation time
-            start_time = time.time()
-            message = await a2a_mcp_coordinator.create_message(
-                sender="perf_test",
-                recipient="research_agent",
-                intent="research_documentation",
-                data={'query': 'performance test'}
-            )
-            creation_time = time.time() - start_time
+            with _Timer() as creation:
+                message = await self.a2a.create_message(
+                    sender="perf_test",
+                    recipient="research_agent",
+                    intent="research_documentation",
+                    data={'query': 'performance test'}
+                )
+            creation_time = creation.elapsed
 
             # Test message routing time
-            start_time = time.time()
-            result = await a2a_mcp_coordinator.route_message(message)
-            routing_time = time.time() - start_time
+            with _Timer() as routing:
+                result = await self.a2a.route_message(message)
+            routing_time = routing.elapsed
 
             # Performance thresholds
             max_creation_time = 0.1  # 100ms
@@ -554,35 +669,37 @@ class EndToEndTestSuite:
     async def test_concurrent_operations(self) -> tuple[bool, str]:
         """Test concurrent operation handling"""
         try:
-            from a2a_mcp_coordinator import a2a_mcp_coordinator
-
-            # Create multiple concurrent messages
-            tasks = []
-            for i in range(5):
-                message = await a2a_mcp_coordinator.create_message(
+            # Create multiple messages concurrently
+            messages = await asyncio.gather(*[
+                self.a2a.create_message(
                     sender=f"concurrent_test_{i}",
                     recipient="research_agent",
                     intent="research_documentation",
                     data={'query': f'concurrent test {i}'}
                 )
-                tasks.append(a2a_mcp_coordinator.route_message(message))
+                for i in range(5)
+            ])
 
             # Execute concurrently
-            start_time = time.time()
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            total_time = time.time() - start_time
+            with _Timer() as timer:
+                results = await asyncio.gather(*[self.a2a.route_message(m) for m in messages], return_exceptions=True)
+            total_time = timer.elapsed
 
             # Check results
-            successful_results = [r for r in results if isinstance(r, dict) and r.get('success')]
-            exceptions = [r for r in results if isinstance(r, Exception)]
+            successful = exceptions = 0
+            for r in results:
+                if isinstance(r, Exception):
+                    exceptions += 1
+                elif isinstance(r, dict) and r.get('success'):
+                    successful += 1
 
             if exceptions:
-                return False, f"Concurrent operations had exceptions: {len(exceptions)}"
+                return False, f"Concurrent operations had exceptions: {exceptions}"
 
-            if len(successful_results) < 4:  # At least 4 should succeed
-                return False, f"Only {len(successful_results)}/5 concurrent operations succeeded"
+            if successful < 4:  # At least 4 should succeed
+                return False, f"Only {successful}/5 concurrent operations succeeded"
 
-            return True, f"Concurrent operations successful: {len(successful_results)}/5 in {total_time:.3f}s"
+            return True, f"Concurrent operations successful: {successful}/5 in {total_time:.3f}s"
 
         except Exception as e:
             return False, f"Concurrent operations test failed: {str(e)}"
@@ -594,101 +711,114 @@ class EndToEndTestSuite:
         logger.info("🧪 STARTING COMPREHENSIVE END-TO-END TEST SUITE")
         logger.info("=" * 70)
 
-        # Infrastructure Tests
-        logger.info("\n📁 INFRASTRUCTURE TESTS")
-        await self.run_test("File Structure Check", self.test_file_structure)
-        await self.run_test("Python Imports", self.test_python_imports)
-        await self.run_test("CSS Syntax Validation", self.test_css_syntax)
-        await self.run_test("TSX Syntax Validation", self.test_tsx_syntax)
-
-        # MCP Bridge Tests
-        logger.info("\n🔧 MCP BRIDGE TESTS")
-        await self.run_test("MCP Bridge Initialization", self.test_mcp_bridge_initialization)
-        await self.run_test("MCP Bridge Health Check", self.test_mcp_bridge_health_check)
-        await self.run_test("MCP Server Communication", self.test_mcp_server_communication)
-
-        # Bridge Manager Tests
-        logger.info("\n🌉 BRIDGE MANAGER TESTS")
-        await self.run_test("Bridge Manager Initialization", self.test_bridge_manager_initialization)
-        await self.run_test("Bridge Manager Health Check", self.test_bridge_manager_health_check)
-        await self.run_test("Bridge Manager Task Routing", self.test_bridge_manager_task_routing)
-
-        # A2A Coordinator Tests
-        logger.info("\n🤖 A2A COORDINATOR TESTS")
-        await self.run_test("A2A Coordinator Initialization", self.test_a2a_coordinator_initialization)
-        await self.run_test("A2A Message Creation", self.test_a2a_message_creation)
-        await self.run_test("A2A Message Routing", self.test_a2a_message_routing)
-
-        # Orchestrator Tests
-        logger.info("\n🎼 ORCHESTRATOR TESTS")
-        await self.run_test("Orchestrator Initialization", self.test_orchestrator_initialization)
-        await self.run_test("Orchestrator Collaboration", self.test_orchestrator_collaboration)
+        # Infrastructure and subsystem initialization tests are independent: one wave
+        logger.info("\n📁 INFRASTRUCTURE & INITIALIZATION TESTS")
+        init_results = await self.run_test_group([
+            ("File Structure Check", self.test_file_structure),
+            ("Python Imports", self.test_python_imports),
+            ("CSS Syntax Validation", self.test_css_syntax),
+            ("TSX Syntax Validation", self.test_tsx_syntax),
+            ("MCP Bridge Initialization", self.test_mcp_bridge_initialization),
+            ("Bridge Manager Initialization", self.test_bridge_manager_initialization),
+            ("A2A Coordinator Initialization", self.test_a2a_coordinator_initialization),
+            ("Orchestrator Initialization", self.test_orchestrator_initialization),
+        ])
+        passed = {r.test_name for r in init_results if r.success}
+
+        # Subsystem tests only run once their initialization test has passed
+        logger.info("\n🔧 MCP BRIDGE / 🌉 BRIDGE MANAGER / 🤖 A2A / 🎼 ORCHESTRATOR TESTS")
+        await self.run_dependent_group([
+            ("MCP Bridge Health Check", self.test_mcp_bridge_health_check, "MCP Bridge Initialization"),
+            ("MCP Server Communication", self.test_mcp_server_communication, "MCP Bridge Initialization"),
+            ("Bridge Manager Health Check", self.test_bridge_manager_health_check, "Bridge Manager Initialization"),
+            ("Bridge Manager Task Routing", self.test_bridge_manager_task_routing, "Bridge Manager Initialization"),
+            ("A2A Message Creation", self.test_a2a_message_creation, "A2A Coordinator Initialization"),
+            ("A2A Message Routing", self.test_a2a_message_routing, "A2A Coordinator Initialization"),
+            ("Orchestrator Collaboration", self.test_orchestrator_collaboration, "Orchestrator Initialization"),
+        ], passed)
 
         # Integration Tests
         logger.info("\n🔗 INTEGRATION TESTS")
-        await self.run_test("Full Workflow Integration", self.test_full_workflow_integration)
+        await self.run_dependent_group([
+            ("Full Workflow Integration", self.test_full_workflow_integration, "A2A Coordinator Initialization"),
+        ], passed)
 
-        # Performance Tests
+        # Performance Tests run one at a time so timings are not skewed by concurrent work
         logger.info("\n⚡ PERFORMANCE TESTS")
-        await self.run_test("Response Times", self.test_response_times)
-        await self.run_test("Concurrent Operations", self.test_concurrent_operations)
+        for performance_test in [
+            ("Response Times", self.test_response_times, "A2A Coordinator Initialization"),
+            ("Concurrent Operations", self.test_concurrent_operations, "A2A Coordinator Initialization"),
+        ]:
+            await self.run_dependent_group([performance_test], passed)
+
+    def _summary_dict(self) -> Dict[str, Any]:
+        return {
+            'total_tests': self.total_tests,
+            'passed_tests': self.passed_tests,
+            'failed_tests': self.failed_tests,
+            'success_rate': (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0,
+            'total_duration': time.time() - self.start_time,
+            'average_test_duration': self._duration_sum / max(self.total_tests, 1)
+        }
 
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate comprehensive test report"""
-        total_duration = time.time() - self.start_time
+    @staticmethod
+    def _result_dict(r: TestResult) -> Dict[str, Any]:
+        return {
+            'test_name': r.test_name,
+            'success': r.success,
+            'details': r.details,
+            'duration': r.duration,
+            'timestamp': datetime.fromtimestamp(r.timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+        }
 
-        report = {
-            'summary': {
-                'total_tests': self.total_tests,
-                'passed_tests': self.passed_tests,
-                'failed_tests': self.failed_tests,
-                'success_rate': (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0,
-                'total_duration': total_duration,
-                'average_test_duration': sum(r.duration for r in self.test_results) / len(self.test_results) if self.test_results else 0
-            },
-            'results': [
-                {
-                    'test_name': r.test_name,
-                    'success': r.success,
-                    'details': r.details,
-                    'duration': r.duration,
-                    'timestamp': r.timestamp.isoformat()
-                }
-                for r in self.test_results
-            ],
-            'failed_tests': [
-                {
-                    'test_name': r.test_name,
-                    'details': r.details,
-                    'duration': r.duration
-                }
-                for r in self.test_results if not r.success
-            ]
+    @staticmethod
+    def _failure_dict(r: TestResult) -> Dict[str, Any]:
+        return {
+            'test_name': r.test_name,
+            'details': r.details,
+            'duration': r.duration
         }
 
-        return report
+    def write_report(self, path: str):
+        """Stream the summary, results and failed tests to disk one record at a time"""
+        with open(path, 'wb') as f:
+            f.write(b'{"summary":')
+            f.write(_dumps(self._summary_dict()))
+            f.write(b',"results":[')
+            # Failures are collected on the results pass so the list is walked once
+            failed = []
+            for i, r in enumerate(self.test_results):
+                if i:
+                    f.write(b',')
+                f.write(_dumps(self._result_dict(r)))
+                if not r.success:
+                    failed.append(r)
+            f.write(b'],"failed_tests":[')
+            f.write(b','.join(_dumps(self._failure_dict(r)) for r in failed))
+            f.write(b']}')
 
     def print_summary(self):
         """Print test summary"""
         total_duration = time.time() - self.start_time
         success_rate = (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0
 
-        logger.info(f"\n🎯 TEST SUMMARY")
+        logger.info("\n🎯 TEST SUMMARY")
         logger.info("=" * 50)
-        logger.info(f"   Total Tests: {self.total_tests}")
-        logger.info(f"   Passed: {self.passed_tests} ✅")
-        logger.info(f"   Failed: {self.failed_tests} ❌")
-        logger.info(f"   Success Rate: {success_rate:.1f}%")
-        logger.info(f"   Total Duration: {total_duration:.2f}s")
-
-        if self.failed_tests > 0:
-            logger.info(f"\n❌ FAILED TESTS:")
+        logger.info("   Total Tests: %d", self.total_tests)
+        logger.info("   Passed: %d ✅", self.passed_tests)
+        logger.info("   Failed: %d ❌", self.failed_tests)
+        logger.info("   Success Rate: %.1f%%", success_rate)
+        logger.info("   Total Duration: %.2fs", total_duration)
+
+        # Skip walking the results entirely when INFO output is silenced
+        if self.failed_tests > 0 and logger.isEnabledFor(logging.INFO):
+            logger.info("\n❌ FAILED TESTS:")
             for result in self.test_results:
                 if not result.success:
-                    logger.info(f"   • {result.test_name}: {result.details}")
+                    logger.info("   • %s: %s", result.test_name, result.details)
 
         overall_status = "✅ ALL TESTS PASSED" if self.failed_tests == 0 else "❌ SOME TESTS FAILED"
-        logger.info(f"\n{overall_status}")
+        logger.info("\n%s", overall_status)
 
 async def main():
     """Main test runner"""
@@ -698,21 +828,17 @@ async def main():
         await test_suite.run_all_tests()
         test_suite.print_summary()
 
-        # Generate detailed report
-        report = test_suite.generate_report()
-
-        # Save report to file
-        report_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Stream detailed report to file
+        report_file = f"test_report_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        test_suite.write_report(report_file)
 
-        logger.info(f"\n📄 Detailed report saved to: {report_file}")
+        logger.info("\n📄 Detailed report saved to: %s", report_file)
 
         # Return exit code based on test results
         return 0 if test_suite.failed_tests == 0 else 1
 
     except Exception as e:
-        logger.info(f"\n💥 TEST SUITE CRASHED: {str(e)}")
+        logger.info("\n💥 TEST SUITE CRASHED: %s", e)
         return 2
 
 if __name__ == "__main__":
@@ -14,14 +14,11 @@ from a2a_framework import (
 )
 
 
-class TestA2AFramework(unittest.TestCase):
+class TestA2AFramework(unittest.IsolatedAsyncioTestCase):
     """TestA2AFramework class for steampunk operations."""
 
-    def setUp(self):
+    async def asyncSetUp(self):
         """Set up test fixtures, if any."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
         # Agent Capabilities
         self.coding_capabilities = [
             AgentCapability("code_generation", "Generate code", ["requirements"], ["code"], 0.9, ["python"]),
@@ -50,36 +47,144 @@ class TestA2AFramework(unittest.TestCase):
         self.assertIn("tester_001", self.coder_agent.peers)
         self.assertIn("coder_001", self.tester_agent.peers)
 
-    def test_send_and_receive_message(self):
+    async def test_send_and_receive_message(self):
         """Test that an agent can send and receive a message."""
-
-        """Run Test with enhanced functionality."""
-        async def run_test():
-            # Start agents
-            await self.coder_agent.start()
-            await self.tester_agent.start()
-
-            # Mock the receive_message method of the tester agent to check if it's called
-            self.tester_agent.receive_message = AsyncMock()
-
-            # Coder sends a message to the tester
-            await self.coder_agent.send_message(
-                receiver_id="tester_001",
-                message_type=MessageType.REQUEST,
-                content={"task": "generate tests"}
-            )
-
-            # Let the event loop run for a bit to process the message
-            await asyncio.sleep(0.1)
-
-            # Assert that the tester agent's receive_message was called
-            self.tester_agent.receive_message.assert_called_once()
-
-            # Stop agents
-            await self.coder_agent.stop()
+        # Start agents
+        await self.coder_agent.start()
+        await self.tester_agent.start()
+
+        # Mock the receive_message method of the tester agent to check if it's called
+        received = asyncio.Event()
+        self.tester_agent.receive_message = AsyncMock(side_effect=lambda *args, **kwargs: received.set())
+
+        # Coder sends a message to the tester
+        await self.coder_agent.send_message(
+            receiver_id="tester_001",
+            message_type=MessageType.REQUEST,
+            content={"task": "generate tests"}
+        )
+
+        # Wake as soon as the message is delivered rather than after a fixed delay
+        await asyncio.wait_for(received.wait(), timeout=1.0)
+
+        # Assert that the tester agent's receive_message was called
+        self.tester_agent.receive_message.assert_called_once()
+
+        # Stop agents
+        await self.coder_agent.stop()
+        await self.tester_agent.stop()
+
+    async def test_send_messages_delivers_batch(self):
+        """Test that a batched send reaches the receiver once per message."""
+        await self.tester_agent.start()
+        self.tester_agent.receive_message = AsyncMock()
+
+        contents = [{"task": f"generate tests {i}"} for i in range(5)]
+        await self.coder_agent.send_messages(
+            receiver_id="tester_001",
+            message_type=MessageType.REQUEST,
+            contents=contents
+        )
+
+        # stop() waits for the inbox to drain
+        await self.tester_agent.stop()
+
+        self.assertEqual(self.tester_agent.receive_message.call_count, len(contents))
+        delivered = [call.args[0].content for call in self.tester_agent.receive_message.call_args_list]
+        self.assertEqual(delivered, contents)
+
+    async def test_single_and_batched_sends_keep_order(self):
+        """Test that a started agent handles messages in the order they were sent."""
+        await self.tester_agent.start()
+        self.tester_agent.receive_message = AsyncMock()
+
+        await self.coder_agent.send_messages("tester_001", MessageType.REQUEST, [{"n": 1}, {"n": 2}])
+        await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 3})
+        await self.tester_agent.stop()
+
+        delivered = [call.args[0].content["n"] for call in self.tester_agent.receive_message.call_args_list]
+        self.assertEqual(delivered, [1, 2, 3])
+
+    async def test_inbox_logs_handler_errors_and_keeps_draining(self):
+        """Test that a failing handler is logged without stalling later messages."""
+        await self.tester_agent.start()
+        self.tester_agent.receive_message = AsyncMock(side_effect=[ValueError("boom"), None])
+
+        with self.assertLogs("a2a_framework", level="ERROR") as logs:
+            await self.coder_agent.send_messages("tester_001", MessageType.REQUEST, [{"n": 1}, {"n": 2}])
             await self.tester_agent.stop()
 
-        self.loop.run_until_complete(run_test())
+        self.assertEqual(self.tester_agent.receive_message.call_count, 2)
+        self.assertIn("tester_001", logs.output[0])
+
+    async def test_stop_surfaces_a_dead_consumer(self):
+        """Test that stop() returns when a handler raises a BaseException instead of hanging."""
+        await self.tester_agent.start()
+        self.tester_agent.receive_message = AsyncMock(side_effect=asyncio.CancelledError)
+
+        await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 1})
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(self.tester_agent.stop(), timeout=1.0)
+
+        # The agent is stopped and delivers inline again
+        self.tester_agent.receive_message = AsyncMock()
+        await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 2})
+        self.tester_agent.receive_message.assert_called_once()
+
+    async def test_stop_delivers_messages_sent_while_stopping(self):
+        """Test that messages queued after stop() begins are still handled, in order."""
+        await self.tester_agent.start()
+        delivered = []
+
+        async def handle(message):
+            delivered.append(message.content["n"])
+            if message.content["n"] == 1:
+                # Lands behind the stop sentinel
+                await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 2})
+
+        self.tester_agent.receive_message = handle
+        await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 1})
+        await asyncio.wait_for(self.tester_agent.stop(), timeout=1.0)
+
+        self.assertEqual(delivered, [1, 2])
+
+    async def test_send_fast_skips_message_allocation(self):
+        """Test that the in-process fast path delivers flattened arguments."""
+        self.tester_agent.receive_message = AsyncMock()
+        self.tester_agent.receive_message_fast = AsyncMock()
+
+        await self.coder_agent.send_fast(
+            receiver_id="tester_001",
+            message_type=MessageType.REQUEST,
+            content={"task": "generate tests"}
+        )
+
+        self.tester_agent.receive_message_fast.assert_called_once_with(
+            "coder_001", MessageType.REQUEST, {"task": "generate tests"}
+        )
+        self.tester_agent.receive_message.assert_not_called()
+
+    async def test_send_fast_falls_back_to_receive_message(self):
+        """Test that an agent overriding only receive_message still gets fast sends."""
+        self.tester_agent.receive_message = AsyncMock()
+
+        await self.coder_agent.send_fast("tester_001", MessageType.REQUEST, {"task": "generate tests"})
+
+        self.tester_agent.receive_message.assert_called_once_with(
+            A2AMessage("coder_001", "tester_001", MessageType.REQUEST, {"task": "generate tests"})
+        )
+
+    async def test_send_fast_keeps_order_on_started_agent(self):
+        """Test that fast sends to a started agent queue behind earlier sends."""
+        await self.tester_agent.start()
+        self.tester_agent.receive_message = AsyncMock()
+
+        await self.coder_agent.send_message("tester_001", MessageType.REQUEST, {"n": 1})
+        await self.coder_agent.send_fast("tester_001", MessageType.REQUEST, {"n": 2})
+        await self.tester_agent.stop()
+
+        delivered = [call.args[0].content["n"] for call in self.tester_agent.receive_message.call_args_list]
+        self.assertEqual(delivered, [1, 2])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,35 @@
+import unittest
+
+from services.ai_providers_simple import SimpleOrchestrator
+
+
+class TestSimpleOrchestrator(unittest.IsolatedAsyncioTestCase):
+    """Validate the canned SimpleOrchestrator responses."""
+
+    async def asyncSetUp(self):
+        self.orchestrator = SimpleOrchestrator()
+
+    async def test_known_paradigm_succeeds(self):
+        result = await self.orchestrator.collaborate('s1', 'mesh', 'Build it', ['gemini'])
+        self.assertEqual(result, {
+            'success': True,
+            'paradigm': 'mesh',
+            'task': 'Build it',
+            'agents': ['gemini'],
+            'status': 'ok',
+        })
+        self.assertIn('s1', self.orchestrator.active_sessions)
+
+    async def test_unknown_paradigm_reports_error(self):
+        result = await self.orchestrator.collaborate('s2', 'invalid_paradigm', 'Build it', ['gemini'])
+        self.assertFalse(result['success'])
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(result['error'], "Unknown paradigm: invalid_paradigm")
+        # The error result carries the same fields as a successful one
+        self.assertEqual(result['paradigm'], 'invalid_paradigm')
+        self.assertEqual(result['agents'], ['gemini'])
+        self.assertNotIn('s2', self.orchestrator.active_sessions)
+
+
+if __name__ == '__main__':
+    unittest.main()
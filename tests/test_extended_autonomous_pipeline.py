@@ -1,9 +1,5 @@
 import unittest
 import asyncio
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from extended_autonomous_pipeline import ExtendedAutonomousPipeline
 from refactored_orchestrator import EnhancedOrchestrator
@@ -12,10 +8,15 @@ from refactored_orchestrator import EnhancedOrchestrator
 class TestExtendedAutonomousPipeline(unittest.IsolatedAsyncioTestCase):
     """Validate the extended SDLC pipeline."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # EnhancedOrchestrator is stateless, so one instance serves every test
+        cls.orchestrator = EnhancedOrchestrator()
+
     async def test_run_pipeline(self):
-        orchestrator = EnhancedOrchestrator()
         agents = ['gemini', 'claude']
-        pipeline = ExtendedAutonomousPipeline(orchestrator, agents)
+        pipeline = ExtendedAutonomousPipeline(self.orchestrator, agents)
         results = await pipeline.run_pipeline('Initial requirements')
         self.assertEqual(len(results), 8)
         expected_names = [
@@ -30,6 +31,38 @@ class TestExtendedAutonomousPipeline(unittest.IsolatedAsyncioTestCase):
         ]
         self.assertEqual([r.name for r in results], expected_names)
 
+    async def test_concurrent_stages_keep_history_order(self):
+        class SkewedOrchestrator(EnhancedOrchestrator):
+            # Earlier stages finish last, so completion order is reversed
+            delays = {'testing': 0.02, 'review': 0.0, 'deployment': 0.02, 'observability': 0.01}
+
+            async def collaborate(self, session_id, paradigm, task, agents, context=None):
+                await asyncio.sleep(self.delays.get(paradigm, 0))
+                return await super().collaborate(session_id, paradigm, task, agents, context)
+
+        pipeline = ExtendedAutonomousPipeline(SkewedOrchestrator(), ['gemini'])
+        results = await pipeline.run_pipeline('Initial requirements')
+        self.assertEqual(
+            [r.name for r in results[3:]],
+            ['automated_testing', 'code_review', 'deployment_orchestration', 'monitoring', 'metrics_feedback'],
+        )
+
+    async def test_failed_wave_records_nothing(self):
+        class FailingReviewOrchestrator(EnhancedOrchestrator):
+            async def collaborate(self, session_id, paradigm, task, agents, context=None):
+                if paradigm == 'review':
+                    raise RuntimeError('review failed')
+                return await super().collaborate(session_id, paradigm, task, agents, context)
+
+        pipeline = ExtendedAutonomousPipeline(FailingReviewOrchestrator(), ['gemini'])
+        with self.assertRaises(RuntimeError):
+            await pipeline.run_pipeline('Initial requirements')
+        # The testing stage finished, but its wave failed, so only the sequential stages are recorded
+        self.assertEqual(
+            [r.name for r in pipeline.history],
+            ['requirement_extraction', 'architecture_synthesis', 'code_generation'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
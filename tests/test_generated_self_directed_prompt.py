@@ -4,20 +4,29 @@ import sys
 from contextlib import redirect_stdout
 import generated_self_directed_prompt
 
+# Compile the script once; each run only executes the cached code object
+with open(generated_self_directed_prompt.__file__, encoding="utf-8") as _f:
+    _PROMPT_CODE = compile(_f.read(), generated_self_directed_prompt.__file__, "exec")
+
+_EXPECTED_PROMPT_SUBSTRINGS = (
+    "You are an autonomous software development orchestrator",
+    "Generate a self-directed prompt that guides AI agents",
+    "Create a detailed, structured prompt that can be used to initiate and sustain autonomous development loops.",
+    "Format the prompt as a multi-line string",
+    "USER TURN",
+    "ASSISTANT TURN",
+)
+
 class TestGeneratedSelfDirectedPrompt(unittest.TestCase):
     """TestGeneratedSelfDirectedPrompt class for steampunk operations."""
     """Test Prompt Output with enhanced functionality."""
     def test_prompt_output(self):
         f = io.StringIO()
         with redirect_stdout(f):
-            exec(open("generated_self_directed_prompt.py").read())
+            exec(_PROMPT_CODE, {"__name__": "__main__"})
         output = f.getvalue()
-        self.assertIn("You are an autonomous software development orchestrator", output)
-        self.assertIn("Generate a self-directed prompt that guides AI agents", output)
-        self.assertIn("Create a detailed, structured prompt that can be used to initiate and sustain autonomous development loops.", output)
-        self.assertIn("Format the prompt as a multi-line string", output)
-        self.assertIn("USER TURN", output)
-        self.assertIn("ASSISTANT TURN", output)
+        missing = [s for s in _EXPECTED_PROMPT_SUBSTRINGS if s not in output]
+        self.assertEqual(missing, [])
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,25 @@
 import unittest
 import asyncio
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from integrated_autonomous_loops import IntegratedAutonomousLoops
 from refactored_orchestrator import EnhancedOrchestrator
 
 class TestIntegratedAutonomousLoops(unittest.IsolatedAsyncioTestCase):
     """TestIntegratedAutonomousLoops class for steampunk operations."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # EnhancedOrchestrator is stateless, so one instance serves every test
+        cls.orchestrator = EnhancedOrchestrator()
+
     """Test Run All Loops Basic with enhanced functionality."""
     async def test_run_all_loops_basic(self):
-        orchestrator = EnhancedOrchestrator()
         agents = ['gemini', 'claude', 'openai']
         task_description = "Test task for integrated autonomous loops"
 
-        loops_runner = IntegratedAutonomousLoops(orchestrator, agents)
-        await loops_runner.run_all_loops(task_description, iterations=2, delay_seconds=1)
+        loops_runner = IntegratedAutonomousLoops(self.orchestrator, agents)
+        await loops_runner.run_all_loops(task_description, iterations=2, delay_seconds=0)
 
         # Check that performance history has entries
         self.assertEqual(len(loops_runner.performance_history), 2)
@@ -34,5 +37,24 @@ class TestIntegratedAutonomousLoops(unittest.IsolatedAsyncioTestCase):
             self.assertTrue(len(entry['feedback_result']) > 0)
             self.assertTrue(len(entry['optimization_result']) > 0)
 
+    async def test_run_all_loops_bounded_concurrency(self):
+        class TrackingOrchestrator(EnhancedOrchestrator):
+            in_flight = 0
+            peak = 0
+
+            async def collaborate(self, *args, **kwargs):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return await super().collaborate(*args, **kwargs)
+
+        orchestrator = TrackingOrchestrator()
+        loops_runner = IntegratedAutonomousLoops(orchestrator, ['gemini'])
+        await loops_runner.run_all_loops("Concurrent task", iterations=10, concurrency=3)
+
+        self.assertEqual(len(loops_runner.performance_history), 10)
+        self.assertEqual(orchestrator.peak, 3)
+
 if __name__ == "__main__":
     unittest.main()
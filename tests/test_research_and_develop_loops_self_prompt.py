@@ -1,20 +1,29 @@
 import unittest
+from pathlib import Path
+
+# The prompt file is immutable during a run; read it once for every test in the module
+_PROMPT_PATH = Path(__file__).resolve().parent.parent / "research_and_develop_loops_self_prompt.txt"
+with open(_PROMPT_PATH, "r", encoding="utf-8") as _f:
+    _CONTENT = _f.read()
+
+_EXPECTED_PROMPT_SUBSTRINGS = (
+    "Research and brainstorm additional autonomous loop types",
+    "Integration plan outlining coordination and management of loops",
+    "Sample code or pseudocode demonstrating loop implementation",
+    "Testing strategy for continuous validation and improvement",
+    "Feedback loops",
+    "Optimization loops",
+    "Testing loops",
+    "Deployment loops",
+    "Knowledge update loops",
+)
 
 class TestResearchAndDevelopLoopsSelfPrompt(unittest.TestCase):
     """TestResearchAndDevelopLoopsSelfPrompt class for steampunk operations."""
     """Test Prompt Content with enhanced functionality."""
     def test_prompt_content(self):
-        with open("research_and_develop_loops_self_prompt.txt", "r", encoding="utf-8") as f:
-            content = f.read()
-        self.assertIn("Research and brainstorm additional autonomous loop types", content)
-        self.assertIn("Integration plan outlining coordination and management of loops", content)
-        self.assertIn("Sample code or pseudocode demonstrating loop implementation", content)
-        self.assertIn("Testing strategy for continuous validation and improvement", content)
-        self.assertIn("Feedback loops", content)
-        self.assertIn("Optimization loops", content)
-        self.assertIn("Testing loops", content)
-        self.assertIn("Deployment loops", content)
-        self.assertIn("Knowledge update loops", content)
+        missing = [s for s in _EXPECTED_PROMPT_SUBSTRINGS if s not in _CONTENT]
+        self.assertEqual(missing, [])
 
 if __name__ == "__main__":
     unittest.main()
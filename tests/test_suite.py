@@ -14,9 +14,14 @@ class TestSuite:
         self.tests_run = 0
         self.tests_passed = 0
         self.tests_failed = 0
+        # Per-case log lines, flushed as one record by report_results
+        self._log_buffer: list[str] = []
 
     def report_results(self):
         """Print a summary of all test results."""
+        if self._log_buffer:
+            logger.info("\n".join(self._log_buffer))
+            self._log_buffer.clear()
         logger.info("\n=== Test Results ===")
         logger.info(f"Total tests run: {self.tests_run}")
         logger.info(f"Tests passed: {self.tests_passed}")
@@ -37,15 +42,15 @@ class TestSuite:
         :return: A context manager for the test case
         """
 
-        logger.info(f"\nRunning test case: {name}")
+        self._log_buffer.append(f"\nRunning test case: {name}")
         try:
             yield
             self.tests_passed += 1
-            logger.info(f"✓ Test case passed: {name}")
+            self._log_buffer.append(f"✓ Test case passed: {name}")
         except Exception as e:
             self.tests_failed += 1
-            logger.info(f"✗ Test case failed: {name}")
-            logger.info(f"  Error: {str(e)}")
+            self._log_buffer.append(f"✗ Test case failed: {name}")
+            self._log_buffer.append(f"  Error: {str(e)}")
         finally:
             self.tests_run += 1
 
@@ -60,15 +65,15 @@ class TestSuite:
         :return: An async context manager for the test case
         """
 
-        logger.info(f"\nRunning async test case: {name}")
+        self._log_buffer.append(f"\nRunning async test case: {name}")
         try:
             yield
             self.tests_passed += 1
-            logger.info(f"✓ Async test case passed: {name}")
+            self._log_buffer.append(f"✓ Async test case passed: {name}")
         except Exception as e:
             self.tests_failed += 1
-            logger.info(f"✗ Async test case failed: {name}")
-            logger.info(f"  Error: {str(e)}")
+            self._log_buffer.append(f"✗ Async test case failed: {name}")
+            self._log_buffer.append(f"  Error: {str(e)}")
         finally:
             self.tests_run += 1
 
@@ -91,5 +96,19 @@ def test_frontend_structure():
 
     suite.report_results()
 
+def test_async_test_case_counts_results():
+    """Async test cases are entered with ``async with`` and tally like sync ones."""
+    suite = TestSuite()
+
+    async def run_cases():
+        async with suite.async_test_case("Async pass"):
+            await asyncio.sleep(0)
+        async with suite.async_test_case("Async fail"):
+            raise ValueError("expected failure")
+
+    asyncio.run(run_cases())
+
+    assert (suite.tests_run, suite.tests_passed, suite.tests_failed) == (2, 1, 1)
+
 if __name__ == "__main__":
     test_frontend_structure()
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from unittest.mock import patch
+
+from web_server import WebHandler
+
+
+class _QuietHandler(WebHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestWebServer(unittest.TestCase):
+    """Serve a temporary static tree over a real socket."""
+
+    SMALL = b"body { color: black; }\n"
+    LARGE = os.urandom(300 * 1024)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        # web_server resolves static/... relative to the working directory
+        cls.addClassCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        os.makedirs("static")
+        for name, data in (("index.html", b"<h1>SDLC</h1>"),
+                           ("style.css", cls.SMALL),
+                           ("bundle.bin", cls.LARGE)):
+            with open(os.path.join("static", name), "wb") as f:
+                f.write(data)
+
+        cls.addClassCleanup(WebHandler._STATIC_CACHE.clear)
+        cls.addClassCleanup(WebHandler._STATIC_TYPES.clear)
+        WebHandler.preload_static()
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _QuietHandler)
+        cls.addClassCleanup(cls.server.server_close)
+        thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        thread.start()
+        cls.addClassCleanup(thread.join)
+        cls.addClassCleanup(cls.server.shutdown)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    def _get(self, path):
+        try:
+            with urllib.request.urlopen(self.base_url + path) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            with e:
+                return e.code, e.headers, e.read()
+
+    def test_index(self):
+        status, headers, body = self._get("/")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-type"], "text/html")
+        self.assertEqual(body, b"<h1>SDLC</h1>")
+
+    def test_health(self):
+        status, headers, body = self._get("/api/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-type"], "application/json")
+        self.assertEqual(json.loads(body)["status"], "healthy")
+
+    def test_small_file_is_served_from_cache(self):
+        self.assertIn("static/style.css", WebHandler._STATIC_CACHE)
+        with patch("builtins.open", side_effect=AssertionError("cached file was reopened")):
+            status, headers, body = self._get("/static/style.css")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-type"], "text/css")
+        self.assertEqual(body, self.SMALL)
+
+    @unittest.skipUnless(hasattr(os, "sendfile"), "os.sendfile is not available")
+    def test_large_file_is_sent_with_sendfile(self):
+        self.assertNotIn("static/bundle.bin", WebHandler._STATIC_CACHE)
+        with patch("web_server.os.sendfile", wraps=os.sendfile) as sendfile:
+            status, headers, body = self._get("/static/bundle.bin")
+        self.assertEqual(status, 200)
+        self.assertEqual(int(headers["Content-Length"]), len(self.LARGE))
+        self.assertEqual(body, self.LARGE)
+        self.assertTrue(sendfile.called)
+
+    def test_unknown_paths_return_404(self):
+        status, _, body = self._get("/api/missing")
+        self.assertEqual(status, 404)
+        self.assertEqual(json.loads(body), {"error": "Not found"})
+        status, _, body = self._get("/static/missing.js")
+        self.assertEqual(status, 404)
+        self.assertEqual(json.loads(body), {"error": "File not found"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,59 +2,126 @@
 """
 Simple web server with frontend and API
 """
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
 import os
 import mimetypes
+import shutil
+
+def _json_body(data):
+    return json.dumps(data, indent=2).encode()
 
 class WebHandler(BaseHTTPRequestHandler):
+    # Fixed API payloads are serialized once, not on every request
+    _HEALTH_BODY = _json_body({"status": "healthy", "service": "SDLC Orchestrator"})
+    _AGENTS_BODY = _json_body({
+        "agents": [
+            {"id": "claude", "name": "Claude", "status": "active"},
+            {"id": "gemini", "name": "Gemini", "status": "active"},
+            {"id": "openai", "name": "OpenAI", "status": "active"}
+        ]
+    })
+    _NOT_FOUND_BODY = _json_body({"error": "Not found"})
+    _FILE_NOT_FOUND_BODY = _json_body({"error": "File not found"})
+
+    # Filled by preload_static(): path -> content type, and path -> (bytes, type) for small files
+    _STATIC_TYPES = {}
+    _STATIC_CACHE = {}
+
+    @classmethod
+    def preload_static(cls, root='static', max_cached_bytes=256 * 1024):
+        """Resolve content types for everything under root once, keeping small files in memory"""
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                key = path.replace(os.sep, '/')
+                content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+                cls._STATIC_TYPES[key] = content_type
+                if os.path.getsize(path) <= max_cached_bytes:
+                    with open(path, 'rb') as f:
+                        cls._STATIC_CACHE[key] = (f.read(), content_type)
+
+    def _serve_index(self):
+        self.serve_file('static/index.html', 'text/html')
+
+    def _serve_health(self):
+        self.write_bytes(self._HEALTH_BODY, 'application/json')
+
+    def _serve_agents(self):
+        self.write_bytes(self._AGENTS_BODY, 'application/json')
+
+    # Exact-path routes; /static/ is matched by prefix only after a miss here
+    _ROUTES = {
+        '/': _serve_index,
+        '/index.html': _serve_index,
+        '/api/health': _serve_health,
+        '/api/agents': _serve_agents,
+    }
+
     def do_GET(self):
-        # Serve frontend files
-        if self.path == '/' or self.path == '/index.html':
-            self.serve_file('static/index.html', 'text/html')
+        handler = self._ROUTES.get(self.path)
+        if handler is not None:
+            handler(self)
         elif self.path.startswith('/static/'):
-            file_path = self.path[1:]  # Remove leading slash
-            self.serve_file(file_path)
-        # API endpoints
-        elif self.path == '/api/health':
-            self.send_json_response({"status": "healthy", "service": "SDLC Orchestrator"})
-        elif self.path == '/api/agents':
-            self.send_json_response({
-                "agents": [
-                    {"id": "claude", "name": "Claude", "status": "active"},
-                    {"id": "gemini", "name": "Gemini", "status": "active"},
-                    {"id": "openai", "name": "OpenAI", "status": "active"}
-                ]
-            })
+            # Serve frontend files
+            self.serve_file(self.path[1:])  # Remove leading slash
         else:
-            self.send_json_response({"error": "Not found"}, 404)
-    
+            self.write_bytes(self._NOT_FOUND_BODY, 'application/json', 404)
+
     def serve_file(self, file_path, content_type=None):
+        entry = self._STATIC_CACHE.get(file_path)
+        if entry is not None:
+            body, cached_type = entry
+            self.write_bytes(body, content_type or cached_type)
+            return
+
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
+            f = open(file_path, 'rb')
+        except FileNotFoundError:
+            self.write_bytes(self._FILE_NOT_FOUND_BODY, 'application/json', 404)
+            return
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+
+            if not content_type:
+                content_type = self._STATIC_TYPES.get(file_path)
             if not content_type:
                 content_type, _ = mimetypes.guess_type(file_path)
                 content_type = content_type or 'application/octet-stream'
-            
+
             self.send_response(200)
             self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(size))
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            self.wfile.write(content)
-        except FileNotFoundError:
-            self.send_json_response({"error": "File not found"}, 404)
-    
-    def send_json_response(self, data, status=200):
+            self.copy_file(f, size)
+
+    def copy_file(self, f, size):
+        # sendfile moves the bytes in-kernel; fall back to a buffered copy where unsupported
+        offset = 0
+        try:
+            out_fd = self.connection.fileno()
+            while offset < size:
+                sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            f.seek(offset)
+            shutil.copyfileobj(f, self.wfile, 64 * 1024)
+
+    def write_bytes(self, body, content_type, status=200):
         self.send_response(status)
-        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
 if __name__ == "__main__":
-    server = HTTPServer(('0.0.0.0', 5000), WebHandler)
+    WebHandler.preload_static()
+    server = ThreadingHTTPServer(('0.0.0.0', 5000), WebHandler)
     print("🚀 SDLC Orchestrator running at:")
     print("   http://localhost:5000")
     print("   http://127.0.0.1:5000")